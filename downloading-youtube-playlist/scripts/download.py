@@ -1,13 +1,171 @@
 #!/usr/bin/env python3
 """
 YouTube playlist video download script
-Supports specifying playlist URL and download range
+Supports specifying playlist URL and download range, or a batch of video URLs
 """
 
 import argparse
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
+
+try:
+    from yt_dlp import YoutubeDL, parse_options
+    from yt_dlp.utils import DownloadError
+except ImportError:
+    # yt-dlp installed as a standalone executable (e.g. Homebrew/apt), not as a Python module
+    YoutubeDL = None
+
+
+def run_yt_dlp(args: list, batch: Optional[List[str]] = None, in_process: bool = True) -> int:
+    """
+    Run yt-dlp with the given command-line arguments
+
+    Uses the yt_dlp Python module in-process when it is importable, avoiding an
+    interpreter start-up and yt-dlp import per call; otherwise falls back to the
+    yt-dlp executable.
+
+    Args:
+        args: yt-dlp command-line arguments (without the program name)
+        batch: URLs to download in this same run (passed to the executable via stdin)
+        in_process: Allow the in-process path; parallel jobs run as child processes
+            instead, so Ctrl-C reaches each yt-dlp directly and stops it at once
+
+    Returns:
+        yt-dlp exit code
+    """
+    if YoutubeDL is None or not in_process:
+        # Standalone executable, or the installed module run as a child process
+        program = ["yt-dlp"] if YoutubeDL is None else [sys.executable, "-m", "yt_dlp"]
+        if batch is None:
+            return subprocess.run(program + args).returncode
+        return subprocess.run(program + ["--batch-file", "-"] + args, input="\n".join(batch), text=True).returncode
+
+    parsed = parse_options(args + ["--"] + batch if batch else args)
+    try:
+        with YoutubeDL(parsed.ydl_opts) as ydl:
+            return ydl.download(parsed.urls)
+    except DownloadError:
+        # yt-dlp has already reported the error
+        return 1
+    except Exception as e:
+        print(f"\nError: yt-dlp failed: {e}", file=sys.stderr)
+        return 1
+
+
+def split_range(start_index: int, end_index: int, parts: int):
+    """
+    Split an inclusive index range into contiguous sub-ranges of near-equal size
+
+    Args:
+        start_index: Starting index (inclusive)
+        end_index: Ending index (inclusive)
+        parts: Number of sub-ranges to produce
+
+    Returns:
+        List of (start, end) tuples covering the whole range in order
+    """
+    total = end_index - start_index + 1
+    parts = max(1, min(parts, total))
+    size, extra = divmod(total, parts)
+
+    ranges = []
+    start = start_index
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0) - 1
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def build_args(
+    output_template: str,
+    quality: str,
+    quiet: bool,
+    concurrent_fragments: int
+) -> list:
+    """
+    Build the yt-dlp arguments shared by playlist and batch downloads
+
+    Args:
+        output_template: yt-dlp output filename template
+        quality: Video quality (best/worst or specific format)
+        quiet: Quiet mode, reduces output
+        concurrent_fragments: Number of fragments of a DASH/HLS video downloaded in parallel
+
+    Returns:
+        yt-dlp command-line arguments (without URLs)
+    """
+    args = [
+        "-o", output_template,
+        "-f", quality,
+        "--merge-output-format", "mp4",
+        "--write-sub",  # Download subtitles
+        "--sub-lang", "zh-Hans,zh-Hant,en",  # Chinese and English subtitles
+        "--embed-subs",  # Embed subtitles
+        "--write-auto-sub",  # Download auto-generated subtitles if manual ones unavailable
+        "--concurrent-fragments", str(concurrent_fragments),  # Parallel fragment downloads per video
+    ]
+
+    # Quiet mode: reduce output but still show video titles and errors
+    if quiet:
+        args.extend([
+            "--no-progress",  # Don't show progress bar
+            "--console-title",  # Don't update console title
+        ])
+
+    return args
+
+
+def download_urls(
+    urls: List[str],
+    output_dir: str = ".",
+    quality: str = "best",
+    quiet: bool = False,
+    concurrent_fragments: int = 4
+):
+    """
+    Download a batch of video URLs in a single yt-dlp run
+
+    Args:
+        urls: Video URLs to download
+        output_dir: Output directory
+        quality: Video quality (best/worst or specific format)
+        quiet: Quiet mode, reduces output (recommended for LLM/automation scenarios)
+        concurrent_fragments: Number of fragments of a DASH/HLS video downloaded in parallel
+    """
+    # Ensure output directory exists
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    args = build_args(f"{output_dir}/%(title)s.%(ext)s", quality, quiet, concurrent_fragments)
+
+    print(f"Starting batch download: {len(urls)} URLs")
+    print(f"Output directory: {output_path.absolute()}")
+    print(f"Video quality: {quality}")
+    if quiet:
+        print(f"Mode: Quiet mode (reduced progress output)")
+    print("-" * 60)
+
+    try:
+        return_code = run_yt_dlp(args, batch=urls)
+        if return_code != 0:
+            print(f"\nError: Download failed (exit code: {return_code})", file=sys.stderr)
+            return 1
+
+        print("\n" + "=" * 60)
+        print("Download complete!")
+        print("=" * 60)
+        return 0
+    except KeyboardInterrupt:
+        print("\nDownload interrupted", file=sys.stderr)
+        return 1
+    except FileNotFoundError:
+        print("\nError: yt-dlp command not found, please install yt-dlp first", file=sys.stderr)
+        print("Installation: pip install yt-dlp", file=sys.stderr)
+        return 1
 
 
 def download_playlist(
@@ -16,7 +174,9 @@ def download_playlist(
     end_index: int = 38,
     output_dir: str = ".",
     quality: str = "best",
-    quiet: bool = False
+    quiet: bool = False,
+    concurrent_fragments: int = 4,
+    jobs: int = 1
 ):
     """
     Download videos from a YouTube playlist within a specified range
@@ -28,44 +188,37 @@ def download_playlist(
         output_dir: Output directory
         quality: Video quality (best/worst or specific format)
         quiet: Quiet mode, reduces output (recommended for LLM/automation scenarios)
+        concurrent_fragments: Number of fragments of a DASH/HLS video downloaded in parallel
+        jobs: Number of videos downloaded in parallel (the range is split across yt-dlp processes)
     """
     # Ensure output directory exists
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Build yt-dlp command
-    cmd = [
-        "yt-dlp",
-        "--playlist-start", str(start_index),
-        "--playlist-end", str(end_index),
-        "-o", f"{output_dir}/%(playlist_index)s - %(title)s.%(ext)s",
-        "-f", quality,
-        "--merge-output-format", "mp4",
-        "--write-sub",  # Download subtitles
-        "--sub-lang", "zh-Hans,zh-Hant,en",  # Chinese and English subtitles
-        "--embed-subs",  # Embed subtitles
-        "--write-auto-sub",  # Download auto-generated subtitles if manual ones unavailable
-    ]
-
-    # Quiet mode: reduce output but still show video titles and errors
-    if quiet:
-        cmd.extend([
-            "--no-progress",  # Don't show progress bar
-            "--console-title",  # Don't update console title
-        ])
+    # Build yt-dlp arguments (the playlist range is added per job below)
+    base_args = build_args(
+        f"{output_dir}/%(playlist_index)s - %(title)s.%(ext)s", quality, quiet, concurrent_fragments
+    )
 
-    cmd.append(playlist_url)
+    # One yt-dlp run per contiguous sub-range, so each run only extracts the playlist once
+    commands = [
+        base_args + ["--playlist-start", str(start), "--playlist-end", str(end), playlist_url]
+        for start, end in split_range(start_index, end_index, jobs)
+    ]
 
     print(f"Starting playlist download: {playlist_url}")
     print(f"Download range: videos {start_index} to {end_index}")
     print(f"Output directory: {output_path.absolute()}")
     print(f"Video quality: {quality}")
+    if len(commands) > 1:
+        print(f"Parallel jobs: {len(commands)}")
     if quiet:
         print(f"Mode: Quiet mode (reduced progress output)")
     print("-" * 60)
 
     if not quiet:
-        print(f"Executing command: {' '.join(cmd)}")
+        for cmd in commands:
+            print(f"Executing command: yt-dlp {' '.join(cmd)}")
         print("-" * 60)
     else:
         print("Download in progress, please wait...")
@@ -73,14 +226,34 @@ def download_playlist(
         print("-" * 60)
 
     try:
-        # Execute download command
-        result = subprocess.run(cmd, check=True)
+        # Execute download commands
+        if len(commands) == 1:
+            # Run on the main thread so Ctrl-C interrupts the download immediately
+            return_codes = [run_yt_dlp(commands[0])]
+        else:
+            executor = ThreadPoolExecutor(max_workers=len(commands))
+            futures = [executor.submit(run_yt_dlp, cmd, in_process=False) for cmd in commands]
+            try:
+                return_codes = [future.result() for future in futures]
+            except KeyboardInterrupt:
+                # The yt-dlp child processes receive the same SIGINT and exit on their own
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
+                raise
+            executor.shutdown()
+
+        failed = [code for code in return_codes if code != 0]
+        if failed:
+            print(f"\nError: Download failed (exit code: {failed[0]})", file=sys.stderr)
+            return 1
+
         print("\n" + "=" * 60)
         print("Download complete!")
         print("=" * 60)
         return 0
-    except subprocess.CalledProcessError as e:
-        print(f"\nError: Download failed (exit code: {e.returncode})", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nDownload interrupted", file=sys.stderr)
         return 1
     except FileNotFoundError:
         print("\nError: yt-dlp command not found, please install yt-dlp first", file=sys.stderr)
@@ -108,15 +281,24 @@ Examples:
 
   # Quiet mode (recommended for LLM/automation scenarios, reduced output)
   %(prog)s -u "https://www.youtube.com/playlist?list=PLAYLIST_ID" --quiet
+
+  # Download a list of video URLs (one per line) in a single yt-dlp run
+  %(prog)s -a urls.txt
         """
     )
 
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+
+    source.add_argument(
         "-u", "--url",
-        required=True,
         help="YouTube playlist URL"
     )
 
+    source.add_argument(
+        "-a", "--batch-file",
+        help="File containing video URLs to download, one per line (\"-\" for stdin)"
+    )
+
     parser.add_argument(
         "-s", "--start",
         type=int,
@@ -149,6 +331,20 @@ Examples:
         help="Quiet mode: reduce output, only show video titles and errors (recommended for LLM/automation scenarios)"
     )
 
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of videos to download in parallel (default: 1)"
+    )
+
+    parser.add_argument(
+        "--concurrent-fragments",
+        type=int,
+        default=4,
+        help="Number of fragments of a DASH/HLS video to download in parallel (default: 4)"
+    )
+
     args = parser.parse_args()
 
     # Validate parameters
@@ -160,6 +356,33 @@ Examples:
         print("Error: Ending index must be >= starting index", file=sys.stderr)
         return 1
 
+    if args.jobs < 1 or args.concurrent_fragments < 1:
+        print("Error: --jobs and --concurrent-fragments must be >= 1", file=sys.stderr)
+        return 1
+
+    if args.batch_file:
+        try:
+            if args.batch_file == "-":
+                lines = sys.stdin.read().splitlines()
+            else:
+                lines = Path(args.batch_file).read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            print(f"Error: Unable to read batch file: {e}", file=sys.stderr)
+            return 1
+
+        urls = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+        if not urls:
+            print("Error: Batch file contains no URLs", file=sys.stderr)
+            return 1
+
+        return download_urls(
+            urls=urls,
+            output_dir=args.output,
+            quality=args.quality,
+            quiet=args.quiet,
+            concurrent_fragments=args.concurrent_fragments
+        )
+
     # Execute download
     return download_playlist(
         playlist_url=args.url,
@@ -167,7 +390,9 @@ Examples:
         end_index=args.end,
         output_dir=args.output,
         quality=args.quality,
-        quiet=args.quiet
+        quiet=args.quiet,
+        concurrent_fragments=args.concurrent_fragments,
+        jobs=args.jobs
     )
 
 
@@ -15,18 +15,98 @@ import argparse
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
+
+# 查询参数：字典或 (键, 值) 对列表（requests 均支持）
+Params = Union[Dict[str, Any], List[Tuple[str, Any]]]
+
+# 各类列表摘要：输出字段名与对应的 API 字段（dict(zip(KEYS, VALUES(item))) 构造摘要）
+_REPO_SUMMARY_KEYS = ("name", "full_name", "description", "stars", "forks", "language", "updated_at", "html_url")
+_REPO_SUMMARY_VALUES = itemgetter(
+    "name", "full_name", "description", "stargazers_count", "forks_count", "language", "updated_at", "html_url"
+)
+
+_STARRED_SUMMARY_KEYS = ("name", "full_name", "description", "stars", "language", "html_url")
+_STARRED_SUMMARY_VALUES = itemgetter("name", "full_name", "description", "stargazers_count", "language", "html_url")
+
+_USER_SUMMARY_KEYS = ("login", "id", "avatar_url", "html_url", "type")
+_USER_SUMMARY_VALUES = itemgetter(*_USER_SUMMARY_KEYS)
+
+_SUBSCRIPTION_SUMMARY_KEYS = ("name", "full_name", "description", "html_url")
+_SUBSCRIPTION_SUMMARY_VALUES = itemgetter(*_SUBSCRIPTION_SUMMARY_KEYS)
+
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    将数据序列化为 UTF-8 编码的 JSON（优先使用 orjson）
+
+    Args:
+        data: 待序列化的数据
+        indent: 是否以 2 空格缩进格式化输出
+
+    Returns:
+        JSON 字节串
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """解析 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class GitHubUserDataFetcher:
     """GitHub 用户数据获取器"""
 
-    def __init__(self, username: str, token: Optional[str] = None, output_dir: str = "./github_user_data"):
+    # 使用一次 GraphQL 请求批量获取各连接的第一页（字段别名与 REST API 保持一致）
+    GRAPHQL_BUNDLE_QUERY = """
+    {
+      user(login: "%s") {
+        followers(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { login id: databaseId avatar_url: avatarUrl html_url: url type: __typename }
+        }
+        following(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { login id: databaseId avatar_url: avatarUrl html_url: url type: __typename }
+        }
+        starredRepositories(first: 100, orderBy: {field: STARRED_AT, direction: DESC}) {
+          pageInfo { hasNextPage }
+          nodes {
+            name
+            full_name: nameWithOwner
+            description
+            stargazers_count: stargazerCount
+            html_url: url
+            primaryLanguage { name }
+          }
+        }
+      }
+    }
+    """
+
+    def __init__(self, username: str, token: Optional[str] = None, output_dir: str = "./github_user_data",
+                 max_workers: int = 8, use_cache: bool = True, verbose: bool = False):
         """
         初始化
 
@@ -34,13 +114,35 @@ class GitHubUserDataFetcher:
             username: GitHub 用户名
             token: GitHub Personal Access Token（可选）
             output_dir: 输出目录
+            max_workers: 并发请求的最大线程数
+            use_cache: 是否使用 ETag 缓存发起条件请求
+            verbose: 是否输出逐页获取、逐个文件保存等详细进度
         """
         self.username = username
         self.token = token
         self.output_dir = Path(output_dir) / username
         self.base_url = "https://api.github.com"
+        self.max_workers = max(1, max_workers)
+        self.verbose = verbose
         self.session = requests.Session()
 
+        # 对 5xx 响应和连接错误按指数退避自动重试（速率限制由 _send 单独处理）；
+        # GraphQL 的 POST 请求只做查询，可以安全重试
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            raise_on_status=False
+        )
+
+        # 连接池大小与并发数一致；连接用尽时等待空闲的 keep-alive 连接，
+        # 而不是新建一个用完即丢弃的连接（每次都要重新进行 TCP + TLS 握手）
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_workers, pool_block=True, max_retries=retries
+        )
+        self.session.mount(self.base_url, adapter)
+
         # 设置请求头
         self.session.headers.update({
             "Accept": "application/vnd.github+json",
@@ -55,26 +157,154 @@ class GitHubUserDataFetcher:
         # 统计信息
         self.stats = {
             "requests_made": 0,
+            "not_modified": 0,
             "data_fetched": {},
             "errors": []
         }
+        self._stats_lock = threading.Lock()
+
+        # 限制同时进行中的请求数（分类任务与分页任务共享）
+        self._request_slots = threading.BoundedSemaphore(self.max_workers)
+
+        # 触发速率限制后，所有线程都暂停发起请求直到该时间点
+        self._rate_limited_until = 0.0
+
+        # 用户中断（Ctrl-C）后置位，通知仍在运行或等待速率限制的工作线程立即退出
+        self._stop = threading.Event()
+
+        # ETag 缓存：上次运行的响应未变化时 GitHub 返回 304，且不计入 rate limit
+        self.use_cache = use_cache
+        self.etag_cache_file = self.output_dir / ".etags.json"
+        self.etag_cache = self._load_etag_cache() if use_cache else {}
+        # 本次运行请求过的缓存键；保存时只写回这些条目，避免缓存无限增长
+        self._etag_keys_used = set()
+
+        # 本次运行内已获取的 GET 响应（缓存键 -> (数据, Link 响应头)），重复请求直接复用
+        self._response_memo = {}
+
+        # GraphQL 预取的数据（连接名 -> {"pageInfo": ..., "nodes": [...]}）
+        self._graphql_bundle = {}
+
+    def _log_detail(self, message: str):
+        """输出详细进度（仅在 verbose 模式下），避免大量逐页/逐文件输出拖慢获取"""
+        if self.verbose:
+            print(message)
+
+    def _count_request(self):
+        """线程安全地累加请求计数"""
+        with self._stats_lock:
+            self.stats["requests_made"] += 1
+
+    def _load_etag_cache(self) -> Dict:
+        """读取上次运行保存的 ETag 缓存"""
+        if not self.etag_cache_file.exists():
+            return {}
+
+        try:
+            return _loads(self.etag_cache_file.read_bytes())
+        except (OSError, ValueError) as e:
+            print(f"  读取 ETag 缓存失败，将重新获取全部数据: {str(e)}", file=sys.stderr)
+            return {}
+
+    def _save_etag_cache(self):
+        """保存 ETag 缓存，供下次运行发起条件请求"""
+        if not self.use_cache:
+            return
+
+        with self._stats_lock:
+            used = {key: self.etag_cache[key] for key in self._etag_keys_used if key in self.etag_cache}
+
+        self.etag_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.etag_cache_file.write_bytes(_dumps(used, indent=False))
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Params] = None) -> str:
+        """根据端点和查询参数生成缓存键"""
+        if not params:
+            return endpoint
+        pairs = params.items() if isinstance(params, dict) else params
+        return f"{endpoint}?{urlencode(sorted(pairs))}"
+
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> Optional[float]:
+        """
+        判断响应是否触发了 GitHub API 速率限制
+
+        Args:
+            response: Response 对象
+
+        Returns:
+            需要等待的秒数；未触发速率限制时返回 None
+        """
+        if response.status_code not in (403, 429):
+            return None
+
+        # 次级速率限制（secondary rate limit）通过 Retry-After 给出等待秒数
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+
+        # 主速率限制用尽：等待到 X-RateLimit-Reset（UTC 时间戳）
+        reset = response.headers.get("X-RateLimit-Reset", "")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset.isdigit():
+            return max(0.0, int(reset) - time.time()) + 1
+
+        return None
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送请求；触发速率限制时等待限制解除后重试
+
+        Args:
+            method: HTTP 方法
+            url: 完整 URL
+            **kwargs: 传给 requests.Session.request 的参数
+
+        Returns:
+            Response 对象
+        """
+        while True:
+            # 等待速率限制解除；期间用户中断则立即退出，而不是睡到限制解除
+            delay = self._rate_limited_until - time.time()
+            if self._stop.wait(delay if delay > 0 else 0):
+                raise KeyboardInterrupt
+
+            self._count_request()
+            with self._request_slots:
+                response = self.session.request(method, url, timeout=30, **kwargs)
+
+            # 请求进行期间用户已中断：丢弃结果，不再继续处理
+            if self._stop.is_set():
+                response.close()
+                raise KeyboardInterrupt
+
+            wait = self._rate_limit_wait(response)
+            if wait is None:
+                return response
+
+            response.close()
+            with self._stats_lock:
+                self._rate_limited_until = max(self._rate_limited_until, time.time() + wait)
+            print(f"⏳ 触发 GitHub API 速率限制，{int(wait)} 秒后重试: {url}", file=sys.stderr)
+
+    def _make_request(self, endpoint: str, params: Optional[Params] = None,
+                      headers: Optional[Dict] = None, stream: bool = False) -> requests.Response:
         """
         发起 API 请求
 
         Args:
             endpoint: API 端点（不包含 base_url）
             params: 查询参数
+            headers: 额外的请求头
+            stream: 是否以流式方式读取响应体
 
         Returns:
             Response 对象
         """
         url = f"{self.base_url}{endpoint}"
-        self.stats["requests_made"] += 1
 
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self._send("GET", url, params=params, headers=headers, stream=stream)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -83,104 +313,279 @@ class GitHubUserDataFetcher:
             print(f"❌ {error_msg}", file=sys.stderr)
             raise
 
-    def _fetch_paginated_data(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+    def _get_json(self, endpoint: str, params: Optional[Params] = None) -> Tuple[Any, str]:
+        """
+        发起带 ETag 缓存的 GET 请求，同一次运行中的重复请求直接返回已获取的结果
+
+        Args:
+            endpoint: API 端点（不包含 base_url）
+            params: 查询参数
+
+        Returns:
+            (解析后的 JSON 数据, Link 响应头)
+        """
+        key = self._cache_key(endpoint, params)
+        memo = self._response_memo.get(key)
+        if memo is not None:
+            return memo
+
+        with self._stats_lock:
+            self._etag_keys_used.add(key)
+        cached = self.etag_cache.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        response = self._make_request(endpoint, params, headers)
+
+        # 304: 数据未变化，直接复用缓存
+        if response.status_code == 304 and cached:
+            with self._stats_lock:
+                self.stats["not_modified"] += 1
+            result = (cached["data"], cached.get("link", ""))
+        else:
+            result = (_loads(response.content), response.headers.get("Link", ""))
+
+            etag = response.headers.get("ETag")
+            if self.use_cache and etag:
+                self.etag_cache[key] = {"etag": etag, "link": result[1], "data": result[0]}
+
+        self._response_memo[key] = result
+        return result
+
+    def _stream_to_disk(self, endpoint: str, filepath: Path, params: Optional[Params] = None):
+        """
+        将响应体原样写入文件，不经过 JSON 解析与重新序列化
+
+        文件已存在且响应为 304 Not Modified 时保留原文件。
+
+        Args:
+            endpoint: API 端点（不包含 base_url）
+            filepath: 目标文件路径
+            params: 查询参数
+        """
+        key = self._cache_key(endpoint, params)
+        with self._stats_lock:
+            self._etag_keys_used.add(key)
+        cached = self.etag_cache.get(key) if filepath.exists() else None
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        with self._make_request(endpoint, params, headers, stream=True) as response:
+            if response.status_code == 304 and cached:
+                with self._stats_lock:
+                    self.stats["not_modified"] += 1
+                self._log_detail(f"  ✓ 未变化，保留: {filepath}")
+                return
+
+            # iter_content 会按 Content-Encoding 解压（response.raw 不会）
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+
+            etag = response.headers.get("ETag")
+            if self.use_cache and etag:
+                self.etag_cache[key] = {"etag": etag}
+
+        self._log_detail(f"  ✓ 已保存到: {filepath}")
+
+    def _fetch_paginated_data(self, endpoint: str, params: Optional[Dict] = None,
+                              on_page: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
         """
         获取分页数据
 
         Args:
             endpoint: API 端点
             params: 查询参数
+            on_page: 按页码顺序对每页数据调用的回调（如写入磁盘），与后续页面的获取同时进行
 
         Returns:
             所有分页数据的列表
         """
         all_data = []
-        page = 1
-        per_page = 100
 
-        if params is None:
-            params = {}
+        def collect(data: List[Dict]):
+            all_data.extend(data)
+            if on_page is not None:
+                on_page(data)
 
-        params["per_page"] = per_page
+        # 公共参数只构造一次并预先排序；每页只追加页码，不修改共享对象，并发获取各页时也是安全的
+        base_params = sorted({**(params or {}), "per_page": 100}.items())
 
-        while True:
-            params["page"] = page
-            print(f"  正在获取第 {page} 页...")
+        def fetch_page(page: int) -> Tuple[Any, str]:
+            self._log_detail(f"  正在获取第 {page} 页...")
+            return self._get_json(endpoint, base_params + [("page", page)])
 
+        page = 1
+        while True:
             try:
-                response = self._make_request(endpoint, params)
-                data = response.json()
+                data, link_header = fetch_page(page)
+            except Exception as e:
+                print(f"  获取第 {page} 页时出错: {str(e)}", file=sys.stderr)
+                break
 
-                if not data:
-                    break
+            if not data:
+                break
 
-                all_data.extend(data)
+            # 检查是否还有下一页
+            if 'rel="next"' not in link_header:
+                collect(data)
+                break
 
-                # 检查是否还有下一页
-                link_header = response.headers.get("Link", "")
-                if 'rel="next"' not in link_header:
-                    break
+            last_page = self._parse_last_page(link_header)
+            if last_page > page:
+                # 已知总页数：并发获取剩余页面，同时按页码顺序处理已到达的页面
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [executor.submit(fetch_page, p) for p in range(page + 1, last_page + 1)]
+                    collect(data)
 
-                page += 1
+                    for page, future in enumerate(futures, start=page + 1):
+                        try:
+                            data, _ = future.result()
+                        except Exception as e:
+                            print(f"  获取第 {page} 页时出错: {str(e)}", file=sys.stderr)
+                            break
 
-            except Exception as e:
-                print(f"  获取第 {page} 页时出错: {str(e)}", file=sys.stderr)
+                        if not data:
+                            break
+
+                        collect(data)
                 break
 
+            # 未提供 rel="last" 时逐页获取
+            collect(data)
+            page += 1
+
         return all_data
 
+    @staticmethod
+    def _parse_last_page(link_header: str) -> int:
+        """
+        从 Link 响应头中解析最后一页的页码
+
+        Args:
+            link_header: Link 响应头，如 '<...&page=2>; rel="next", <...&page=5>; rel="last"'
+
+        Returns:
+            最后一页的页码；没有 rel="last" 时返回 0
+        """
+        for link in link_header.split(","):
+            url, _, rel = link.partition(";")
+            if 'rel="last"' in rel:
+                query = parse_qs(urlparse(url.strip(" <>")).query)
+                return int(query.get("page", ["0"])[0])
+        return 0
+
+    def _run_concurrently(self, tasks: List[Callable[[], Any]]):
+        """
+        并发执行互不依赖的获取任务
+
+        Args:
+            tasks: 无参数的获取函数列表
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {executor.submit(task): task for task in tasks}
+        try:
+            # 等待所有任务结束；单个任务失败只记录错误，不影响其他任务
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    error_msg = f"任务失败: {futures[future].__name__} - {str(e)}"
+                    with self._stats_lock:
+                        self.stats["errors"].append(error_msg)
+                    print(f"❌ {error_msg}", file=sys.stderr)
+        except KeyboardInterrupt:
+            # 取消尚未开始的任务，通知运行中的任务停止，且不等待它们结束
+            self._stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            raise
+        executor.shutdown()
+
     def _save_json(self, data: Any, filepath: Path):
         """保存 JSON 数据到文件"""
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"  ✓ 已保存到: {filepath}")
+        filepath.write_bytes(_dumps(data))
+        self._log_detail(f"  ✓ 已保存到: {filepath}")
 
-    def fetch_profile(self) -> Dict:
+    def fetch_profile(self):
         """获取用户基本信息"""
         print(f"\n📝 获取用户基本信息...")
-        response = self._make_request(f"/users/{self.username}")
-        profile = response.json()
-
-        self._save_json(profile, self.output_dir / "profile.json")
+        # 用户信息原样保存，直接将响应体写入文件
+        self._stream_to_disk(f"/users/{self.username}", self.output_dir / "profile.json")
         self.stats["data_fetched"]["profile"] = True
-        return profile
 
-    def fetch_repositories(self):
+    def fetch_repositories(self) -> List[Dict]:
         """获取用户仓库"""
         print(f"\n📦 获取用户仓库...")
-        repos = self._fetch_paginated_data(
-            f"/users/{self.username}/repos",
-            {"type": "all", "sort": "updated"}
-        )
+        repos_dir = self.output_dir / "repositories"
+        repos_dir.mkdir(parents=True, exist_ok=True)
+
+        # 每到达一页即写入其中仓库的详细信息（JSON Lines，每行一个仓库），同时生成列表摘要
+        repos_summary = []
+        details_file = repos_dir / "details.jsonl"
+        with open(details_file, 'wb') as f:
+            def save_page(page_repos: List[Dict]):
+                for repo in page_repos:
+                    f.write(_dumps(repo, indent=False) + b"\n")
+                    repos_summary.append(dict(zip(_REPO_SUMMARY_KEYS, _REPO_SUMMARY_VALUES(repo))))
+
+            repos = self._fetch_paginated_data(
+                f"/users/{self.username}/repos",
+                {"type": "all", "sort": "updated"},
+                on_page=save_page
+            )
+        self._log_detail(f"  ✓ 已保存到: {details_file}")
 
         # 保存仓库列表摘要
-        repos_summary = [{
-            "name": repo["name"],
-            "full_name": repo["full_name"],
-            "description": repo["description"],
-            "stars": repo["stargazers_count"],
-            "forks": repo["forks_count"],
-            "language": repo["language"],
-            "updated_at": repo["updated_at"],
-            "html_url": repo["html_url"]
-        } for repo in repos]
-
-        self._save_json(repos_summary, self.output_dir / "repositories" / "list.json")
-
-        # 保存每个仓库的详细信息
-        details_dir = self.output_dir / "repositories" / "details"
-        for repo in repos:
-            repo_name = repo["name"]
-            self._save_json(repo, details_dir / f"{repo_name}.json")
+        self._save_json(repos_summary, repos_dir / "list.json")
 
         self.stats["data_fetched"]["repositories"] = len(repos)
         print(f"  共获取 {len(repos)} 个仓库")
+        return repos
+
+    def fetch_repositories_with_stats(self):
+        """获取用户仓库，并直接基于内存中的仓库数据计算统计信息"""
+        repos = self.fetch_repositories()
+        by_language = self._aggregate_by_language(repos)
+        self.compute_language_stats(by_language)
+        self.compute_repository_stats(by_language)
+
+    @staticmethod
+    def _aggregate_by_language(repos: List[Dict]) -> Dict[Optional[str], Dict[str, int]]:
+        """
+        单次遍历按编程语言汇总仓库数、大小、Stars 和 Forks
+
+        Args:
+            repos: fetch_repositories 返回的仓库列表
+
+        Returns:
+            语言 -> 汇总数据（未识别语言的仓库归入 None），按语言首次出现的顺序排列
+        """
+        by_language = {}
+        for repo in repos:
+            language = repo.get("language") or None
+            totals = by_language.get(language)
+            if totals is None:
+                totals = by_language[language] = {"repos": 0, "size_kb": 0, "stars": 0, "forks": 0}
+
+            totals["repos"] += 1
+            totals["size_kb"] += repo.get("size", 0)
+            totals["stars"] += repo.get("stargazers_count", 0)
+            totals["forks"] += repo.get("forks_count", 0)
+        return by_language
 
     def fetch_gists(self):
         """获取用户 Gists"""
         print(f"\n📄 获取用户 Gists...")
-        gists = self._fetch_paginated_data(f"/users/{self.username}/gists")
+        details_dir = self.output_dir / "gists" / "details"
+
+        # 每到达一页即保存其中每个 gist 的详细信息
+        def save_page(page_gists: List[Dict]):
+            for gist in page_gists:
+                self._save_json(gist, details_dir / f"{gist['id']}.json")
+
+        gists = self._fetch_paginated_data(f"/users/{self.username}/gists", on_page=save_page)
 
         # 保存 gists 列表
         gists_summary = [{
@@ -195,32 +600,21 @@ class GitHubUserDataFetcher:
 
         self._save_json(gists_summary, self.output_dir / "gists" / "list.json")
 
-        # 保存每个 gist 的详细信息
-        details_dir = self.output_dir / "gists" / "details"
-        for gist in gists:
-            gist_id = gist["id"]
-            self._save_json(gist, details_dir / f"{gist_id}.json")
-
         self.stats["data_fetched"]["gists"] = len(gists)
         print(f"  共获取 {len(gists)} 个 Gists")
 
     def fetch_starred(self):
         """获取用户 starred 的仓库"""
         print(f"\n⭐ 获取 Starred 仓库...")
-        starred = self._fetch_paginated_data(
-            f"/users/{self.username}/starred",
-            {"sort": "created"}
-        )
+        starred = self._get_bundled("starredRepositories")
+        if starred is None:
+            starred = self._fetch_paginated_data(
+                f"/users/{self.username}/starred",
+                {"sort": "created"}
+            )
 
         # 保存 starred 仓库列表
-        starred_summary = [{
-            "name": repo["name"],
-            "full_name": repo["full_name"],
-            "description": repo["description"],
-            "stars": repo["stargazers_count"],
-            "language": repo["language"],
-            "html_url": repo["html_url"]
-        } for repo in starred]
+        starred_summary = [dict(zip(_STARRED_SUMMARY_KEYS, _STARRED_SUMMARY_VALUES(repo))) for repo in starred]
 
         self._save_json(starred_summary, self.output_dir / "starred" / "repositories.json")
         self.stats["data_fetched"]["starred"] = len(starred)
@@ -229,16 +623,12 @@ class GitHubUserDataFetcher:
     def fetch_followers(self):
         """获取用户的 Followers"""
         print(f"\n👥 获取 Followers...")
-        followers = self._fetch_paginated_data(f"/users/{self.username}/followers")
+        followers = self._get_bundled("followers")
+        if followers is None:
+            followers = self._fetch_paginated_data(f"/users/{self.username}/followers")
 
         # 保存 followers 列表
-        followers_summary = [{
-            "login": user["login"],
-            "id": user["id"],
-            "avatar_url": user["avatar_url"],
-            "html_url": user["html_url"],
-            "type": user["type"]
-        } for user in followers]
+        followers_summary = [dict(zip(_USER_SUMMARY_KEYS, _USER_SUMMARY_VALUES(user))) for user in followers]
 
         self._save_json(followers_summary, self.output_dir / "social" / "followers.json")
         self.stats["data_fetched"]["followers"] = len(followers)
@@ -247,16 +637,12 @@ class GitHubUserDataFetcher:
     def fetch_following(self):
         """获取用户 Following 的人"""
         print(f"\n👤 获取 Following...")
-        following = self._fetch_paginated_data(f"/users/{self.username}/following")
+        following = self._get_bundled("following")
+        if following is None:
+            following = self._fetch_paginated_data(f"/users/{self.username}/following")
 
         # 保存 following 列表
-        following_summary = [{
-            "login": user["login"],
-            "id": user["id"],
-            "avatar_url": user["avatar_url"],
-            "html_url": user["html_url"],
-            "type": user["type"]
-        } for user in following]
+        following_summary = [dict(zip(_USER_SUMMARY_KEYS, _USER_SUMMARY_VALUES(user))) for user in following]
 
         self._save_json(following_summary, self.output_dir / "social" / "following.json")
         self.stats["data_fetched"]["following"] = len(following)
@@ -266,6 +652,8 @@ class GitHubUserDataFetcher:
         """获取用户所属的组织"""
         print(f"\n🏢 获取用户组织...")
         try:
+            # 组织始终通过 REST API 获取：GraphQL 的 organizations 会包含令牌可见的私有成员关系，
+            # REST API 只返回公开的组织成员关系
             orgs = self._fetch_paginated_data(f"/users/{self.username}/orgs")
 
             # 保存组织列表
@@ -313,12 +701,9 @@ class GitHubUserDataFetcher:
             # 注意：这个端点可能需要认证，并且只能获取认证用户自己的订阅
             subscriptions = self._fetch_paginated_data(f"/users/{self.username}/subscriptions")
 
-            subscriptions_summary = [{
-                "name": repo["name"],
-                "full_name": repo["full_name"],
-                "description": repo["description"],
-                "html_url": repo["html_url"]
-            } for repo in subscriptions]
+            subscriptions_summary = [
+                dict(zip(_SUBSCRIPTION_SUMMARY_KEYS, _SUBSCRIPTION_SUMMARY_VALUES(repo))) for repo in subscriptions
+            ]
 
             self._save_json(subscriptions_summary, self.output_dir / "subscriptions.json")
             self.stats["data_fetched"]["subscriptions"] = len(subscriptions)
@@ -337,11 +722,10 @@ class GitHubUserDataFetcher:
         Returns:
             响应数据
         """
-        url = "https://api.github.com/graphql"
-        self.stats["requests_made"] += 1
+        url = f"{self.base_url}/graphql"
 
         try:
-            response = self.session.post(url, json={"query": query}, timeout=30)
+            response = self._send("POST", url, json={"query": query})
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -350,6 +734,39 @@ class GitHubUserDataFetcher:
             print(f"❌ {error_msg}", file=sys.stderr)
             raise
 
+    def _prefetch_graphql_bundle(self):
+        """使用一次 GraphQL 请求预取社交关系和 Starred 仓库的第一页"""
+        print(f"\n🧩 批量预取社交与 Starred 数据（GraphQL）...")
+        try:
+            result = self._make_graphql_request(self.GRAPHQL_BUNDLE_QUERY % self.username)
+            user = (result.get("data") or {}).get("user")
+            if not user:
+                print("  批量预取失败，将使用 REST API 获取", file=sys.stderr)
+                return
+
+            # primaryLanguage 为嵌套对象，展开为 REST API 的 language 字段
+            for repo in user["starredRepositories"]["nodes"]:
+                repo["language"] = (repo.pop("primaryLanguage") or {}).get("name")
+
+            self._graphql_bundle = user
+        except Exception as e:
+            print(f"  批量预取失败，将使用 REST API 获取: {str(e)}", file=sys.stderr)
+
+    def _get_bundled(self, connection: str) -> Optional[List[Dict]]:
+        """
+        读取 GraphQL 预取的数据
+
+        Args:
+            connection: GraphQL 连接名
+
+        Returns:
+            节点列表；未预取或数据超过一页时返回 None，需通过 REST API 分页获取
+        """
+        data = self._graphql_bundle.get(connection)
+        if not data or data["pageInfo"]["hasNextPage"]:
+            return None
+        return data["nodes"]
+
     def fetch_contribution_calendar(self):
         """获取用户贡献日历（使用 GraphQL API）"""
         print(f"\n📊 获取贡献日历...")
@@ -395,11 +812,10 @@ class GitHubUserDataFetcher:
         print(f"\n🔀 获取 Pull Requests...")
         try:
             # 使用 Search API 搜索用户创建的 PR
-            response = self._make_request(
+            search_result, _ = self._get_json(
                 "/search/issues",
                 {"q": f"author:{self.username} type:pr", "per_page": 100, "sort": "created", "order": "desc"}
             )
-            search_result = response.json()
             total_count = search_result.get("total_count", 0)
 
             # 获取前 100 个 PR 的详细信息
@@ -433,11 +849,10 @@ class GitHubUserDataFetcher:
         print(f"\n🐛 获取 Issues...")
         try:
             # 使用 Search API 搜索用户创建的 issue
-            response = self._make_request(
+            search_result, _ = self._get_json(
                 "/search/issues",
                 {"q": f"author:{self.username} type:issue", "per_page": 100, "sort": "created", "order": "desc"}
             )
-            search_result = response.json()
             total_count = search_result.get("total_count", 0)
 
             # 获取前 100 个 issue 的详细信息
@@ -466,35 +881,23 @@ class GitHubUserDataFetcher:
             print(f"  获取 Issues 失败: {str(e)}", file=sys.stderr)
             self.stats["data_fetched"]["issues"] = 0
 
-    def fetch_language_stats(self):
-        """获取用户的编程语言统计"""
+    def compute_language_stats(self, by_language: Dict[Optional[str], Dict[str, int]]):
+        """
+        统计用户的编程语言分布
+
+        Args:
+            by_language: _aggregate_by_language 返回的按语言汇总数据
+        """
         print(f"\n💻 统计编程语言分布...")
         try:
-            # 读取已保存的仓库数据
-            repos_dir = self.output_dir / "repositories" / "details"
-            if not repos_dir.exists():
-                print("  需要先获取仓库数据", file=sys.stderr)
-                return
-
-            language_stats = {}
-            total_size = 0
-
-            # 遍历所有仓库，统计语言
-            for repo_file in repos_dir.glob("*.json"):
-                with open(repo_file, 'r', encoding='utf-8') as f:
-                    repo = json.load(f)
-                    language = repo.get("language")
-                    size = repo.get("size", 0)
-
-                    if language:
-                        if language not in language_stats:
-                            language_stats[language] = {
-                                "repo_count": 0,
-                                "total_size_kb": 0
-                            }
-                        language_stats[language]["repo_count"] += 1
-                        language_stats[language]["total_size_kb"] += size
-                        total_size += size
+            language_stats = {
+                language: {
+                    "repo_count": totals["repos"],
+                    "total_size_kb": totals["size_kb"]
+                }
+                for language, totals in by_language.items() if language
+            }
+            total_size = sum(stats["total_size_kb"] for stats in language_stats.values())
 
             # 计算百分比
             for lang in language_stats:
@@ -520,44 +923,31 @@ class GitHubUserDataFetcher:
             print(f"  统计编程语言失败: {str(e)}", file=sys.stderr)
             self.stats["data_fetched"]["language_stats"] = 0
 
-    def fetch_repository_stats(self):
-        """获取仓库的详细统计信息"""
+    def compute_repository_stats(self, by_language: Dict[Optional[str], Dict[str, int]]):
+        """
+        统计仓库的 Stars / Forks 等汇总信息
+
+        Args:
+            by_language: _aggregate_by_language 返回的按语言汇总数据
+        """
         print(f"\n📈 获取仓库统计信息...")
         try:
-            # 读取已保存的仓库列表
-            repos_list_file = self.output_dir / "repositories" / "list.json"
-            if not repos_list_file.exists():
-                print("  需要先获取仓库数据", file=sys.stderr)
-                return
-
-            with open(repos_list_file, 'r', encoding='utf-8') as f:
-                repos = json.load(f)
-
+            # 总计包含未识别语言的仓库
             stats_summary = {
-                "total_stars": 0,
-                "total_forks": 0,
+                "total_stars": sum(totals["stars"] for totals in by_language.values()),
+                "total_forks": sum(totals["forks"] for totals in by_language.values()),
                 "total_watchers": 0,
-                "total_repos": len(repos),
-                "by_language": {}
+                "total_repos": sum(totals["repos"] for totals in by_language.values()),
+                "by_language": {
+                    language: {
+                        "repos": totals["repos"],
+                        "stars": totals["stars"],
+                        "forks": totals["forks"]
+                    }
+                    for language, totals in by_language.items() if language
+                }
             }
 
-            # 统计所有仓库的数据
-            for repo in repos:
-                stats_summary["total_stars"] += repo.get("stars", 0)
-                stats_summary["total_forks"] += repo.get("forks", 0)
-
-                language = repo.get("language")
-                if language:
-                    if language not in stats_summary["by_language"]:
-                        stats_summary["by_language"][language] = {
-                            "repos": 0,
-                            "stars": 0,
-                            "forks": 0
-                        }
-                    stats_summary["by_language"][language]["repos"] += 1
-                    stats_summary["by_language"][language]["stars"] += repo.get("stars", 0)
-                    stats_summary["by_language"][language]["forks"] += repo.get("forks", 0)
-
             self._save_json(stats_summary, self.output_dir / "statistics" / "repositories.json")
             self.stats["data_fetched"]["repository_stats"] = True
             print(f"  总计: {stats_summary['total_stars']} Stars, {stats_summary['total_forks']} Forks")
@@ -586,43 +976,51 @@ class GitHubUserDataFetcher:
         # 确保输出目录存在
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 依次获取各类数据
         try:
-            # 基础数据
+            # 用户基本信息（同时校验用户是否存在）
             self.fetch_profile()
-            self.fetch_repositories()
-            self.fetch_gists()
-            self.fetch_starred()
 
-            # 社交数据
-            self.fetch_followers()
-            self.fetch_following()
-            self.fetch_organizations()
+            tasks = [
+                # 基础数据（仓库统计直接基于获取到的仓库数据计算）
+                self.fetch_repositories_with_stats,
+                self.fetch_gists,
+                self.fetch_starred,
+
+                # 社交数据
+                self.fetch_followers,
+                self.fetch_following,
+                self.fetch_organizations,
 
-            # 活动数据
-            self.fetch_events()
-            self.fetch_subscriptions()
+                # 活动数据
+                self.fetch_events,
+                self.fetch_subscriptions,
+
+                # 协作数据
+                self.fetch_pull_requests,
+                self.fetch_issues,
+            ]
 
             # 贡献数据（需要 token，使用 GraphQL）
             if self.token:
-                self.fetch_contribution_calendar()
+                tasks.append(self.fetch_contribution_calendar)
             else:
                 print("\n⚠️  跳过贡献日历获取（需要 Personal Access Token）")
 
-            # 协作数据
-            self.fetch_pull_requests()
-            self.fetch_issues()
+            # GraphQL 需要 token：一次请求预取多类数据的第一页，数据不超过一页时可省去对应的 REST 请求
+            if self.token:
+                self._prefetch_graphql_bundle()
 
-            # 统计数据（依赖前面获取的数据）
-            self.fetch_language_stats()
-            self.fetch_repository_stats()
+            # 各类数据互不依赖，并发获取
+            self._run_concurrently(tasks)
 
         except KeyboardInterrupt:
+            self._stop.set()
             print("\n\n⚠️  用户中断操作")
         except Exception as e:
             print(f"\n\n❌ 发生错误: {str(e)}", file=sys.stderr)
         finally:
-            # 保存元数据
+            # 保存 ETag 缓存和元数据
+            self._save_etag_cache()
             self.save_metadata()
 
             # 打印统计信息
@@ -634,6 +1032,8 @@ class GitHubUserDataFetcher:
         print("📊 数据获取完成！统计信息:")
         print("=" * 60)
         print(f"总共发起的 API 请求数: {self.stats['requests_made']}")
+        if self.stats['not_modified']:
+            print(f"其中命中 ETag 缓存（304 Not Modified）: {self.stats['not_modified']}")
         print(f"\n已获取的数据:")
         for key, value in self.stats['data_fetched'].items():
             if isinstance(value, int):
@@ -689,13 +1089,35 @@ def main():
         default="./github_user_data"
     )
 
+    parser.add_argument(
+        "-w", "--workers",
+        help="并发请求数（默认: 8）",
+        type=int,
+        default=8
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        help="不使用 ETag 缓存，强制重新获取全部数据",
+        action="store_true"
+    )
+
+    parser.add_argument(
+        "-v", "--verbose",
+        help="输出逐页获取、逐个文件保存等详细进度",
+        action="store_true"
+    )
+
     args = parser.parse_args()
 
     # 创建 fetcher 并执行
     fetcher = GitHubUserDataFetcher(
         username=args.username,
         token=args.token,
-        output_dir=args.output
+        output_dir=args.output,
+        max_workers=args.workers,
+        use_cache=not args.no_cache,
+        verbose=args.verbose
     )
 
     fetcher.fetch_all()
@@ -6,14 +6,39 @@ Supports text-to-image and image-to-image generation with various models.
 """
 
 import argparse
-import base64
 import json
+import mimetypes
+import mmap
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
 import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib base64 functions used here
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib json module is used when it is not installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; without it the whole response body is buffered and parsed at once
+    ijson = None
+
+# Errors raised while parsing a malformed response body (ijson reads straight from the socket)
+_JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
 
 
 # Default configuration values
@@ -21,6 +46,24 @@ DEFAULT_MODEL = "google/gemini-2.5-flash-image"
 DEFAULT_ASPECT_RATIO = "1:1"
 DEFAULT_TIMEOUT = 60
 
+# Slice size for streaming base64 encoding (a multiple of 3, so no padding mid-stream)
+ENCODE_CHUNK_SIZE = 57 * 1024
+
+# Slice size for streaming base64 decoding (a multiple of 4, so each slice decodes on its own)
+DECODE_CHUNK_SIZE = 64 * 1024
+
+# Any whitespace inside a base64 body (line wrapping)
+_WHITESPACE = re.compile(r"\s")
+
+# MIME types of common reference image extensions
+_EXT_TO_MIME = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
 
 def get_api_key() -> str:
     """
@@ -38,27 +81,87 @@ def get_api_key() -> str:
     return api_key
 
 
+def _dumps(data, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse a UTF-8 encoded JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that retries rate-limited and unavailable responses.
+
+    Retries use exponential backoff and honour the Retry-After header. Only 429 and
+    503 are retried: the server rejected those requests without processing them,
+    whereas a 500/502/504 may follow a generation that was already completed (and billed).
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 503],
+        allowed_methods=["GET", "POST"],
+        read=False,  # Don't resend a request the server may already be generating
+        raise_on_status=False
+    )
+    session.mount("https://", requests.adapters.HTTPAdapter(max_retries=retry))
+    return session
+
+
+def read_json_response(response: requests.Response):
+    """
+    Parse a JSON response body.
+
+    With ijson installed the body is parsed straight from the socket, so the
+    embedded base64 image exists only once in memory instead of as raw bytes,
+    decoded text and parsed value.
+    """
+    if ijson is None:
+        return _loads(response.content)
+
+    response.raw.decode_content = True
+    try:
+        return next(ijson.items(response.raw, "", use_float=True))
+    finally:
+        response.close()
+
+
 def encode_image_to_base64(image_path: str) -> str:
     """Convert local image to base64 encoded data URL."""
-    if not os.path.exists(image_path):
+    # One stat call gives both existence and size
+    try:
+        file_size = os.stat(image_path).st_size
+    except FileNotFoundError:
         print(f"Error: Reference image not found: {image_path}", file=sys.stderr)
         sys.exit(1)
 
     try:
+        # Detect image type from extension
+        ext = os.path.splitext(image_path)[1].lower()
+        mime_type = _EXT_TO_MIME.get(ext)
+        if mime_type is None:
+            guessed, _ = mimetypes.guess_type(image_path)
+            mime_type = guessed if guessed and guessed.startswith("image/") else 'image/png'
+
+        # Memory-map the file and encode it slice by slice: the kernel pages the image in
+        # on demand and no raw copy is ever read into a heap buffer
+        data_url = bytearray(f"data:{mime_type};base64,".encode("ascii"))
         with open(image_path, "rb") as image_file:
-            encoded = base64.b64encode(image_file.read()).decode('utf-8')
+            if file_size:  # empty files cannot be mapped
+                with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as view:
+                    for offset in range(0, len(view), ENCODE_CHUNK_SIZE):
+                        data_url += base64.b64encode(view[offset:offset + ENCODE_CHUNK_SIZE])
 
-        # Detect image type from extension
-        ext = Path(image_path).suffix.lower()
-        mime_type = {
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }.get(ext, 'image/png')
-
-        return f"data:{mime_type};base64,{encoded}"
+        return data_url.decode("ascii")
     except Exception as e:
         print(f"Error: Failed to read reference image: {e}", file=sys.stderr)
         sys.exit(1)
@@ -70,7 +173,8 @@ def generate_image(
     prompt: str,
     reference_image_path: Optional[str] = None,
     aspect_ratio: str = "1:1",
-    timeout: int = 60
+    timeout: int = 60,
+    session: Optional[requests.Session] = None
 ) -> str:
     """
     Call OpenRouter API to generate an image.
@@ -82,6 +186,7 @@ def generate_image(
         reference_image_path: Optional reference image path
         aspect_ratio: Image aspect ratio
         timeout: Request timeout in seconds
+        session: Optional HTTP session (a retrying session is created if omitted)
 
     Returns:
         Generated image as base64 data URL
@@ -134,14 +239,16 @@ def generate_image(
     print("Calling OpenRouter API...")
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        response = (session or create_session()).post(
+            url, headers=headers, data=_dumps(payload), timeout=timeout, stream=ijson is not None
+        )
 
         if response.status_code != 200:
             print(f"Error: API request failed with status {response.status_code}", file=sys.stderr)
             print(f"Response: {response.text}", file=sys.stderr)
             sys.exit(1)
 
-        result = response.json()
+        result = read_json_response(response)
 
         # Extract generated image from response
         if "choices" in result and len(result["choices"]) > 0:
@@ -166,42 +273,88 @@ def generate_image(
 
         print("Error: No image found in API response", file=sys.stderr)
         print("Response structure:", file=sys.stderr)
-        print(json.dumps(result, indent=2), file=sys.stderr)
+        print(_dumps(result, indent=True).decode("utf-8"), file=sys.stderr)
         sys.exit(1)
 
-    except requests.exceptions.Timeout:
+    # A streamed body is read through urllib3 directly, so its errors are not wrapped by requests
+    except (requests.exceptions.Timeout, ReadTimeoutError):
         print(f"Error: Request timed out after {timeout} seconds", file=sys.stderr)
         sys.exit(1)
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
         print(f"Error: Network error: {e}", file=sys.stderr)
         sys.exit(1)
+    except _JSON_ERRORS as e:
+        print(f"Error: Invalid JSON in API response: {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Error: Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def save_base64_image(base64_data: str, output_path: str):
-    """Save base64 encoded image to local file."""
-    # Remove data URL prefix if present
-    if base64_data.startswith("data:image"):
-        base64_data = base64_data.split(",", 1)[1]
+def save_base64_image(
+    base64_data: str,
+    output_path: str,
+    session: Optional[requests.Session] = None,
+    timeout: int = DEFAULT_TIMEOUT
+):
+    """
+    Save generated image to local file.
 
-    try:
-        # Decode and save
-        image_data = base64.b64decode(base64_data)
+    Args:
+        base64_data: Base64 data URL, bare base64 body, or an HTTP(S) URL of a hosted image
+        output_path: Output file path
+        session: Optional HTTP session used to download hosted images
+        timeout: Download timeout in seconds for hosted images
+    """
+    # Write to a temporary file next to the output and move it into place only once
+    # complete, so a failed download or decode never leaves a broken image behind
+    temp_path = f"{output_path}.part"
 
+    try:
         # Create output directory if it doesn't exist
         output_dir = Path(output_path).parent
         if output_dir and not output_dir.exists():
             output_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "wb") as f:
-            f.write(image_data)
+        if base64_data.startswith(("https://", "http://")):
+            # Hosted image: stream the download straight to disk, no base64 involved
+            with (session or create_session()).get(base64_data, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                with open(temp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DECODE_CHUNK_SIZE):
+                        f.write(chunk)
+                    file_size = f.tell()
+        else:
+            # Skip data URL prefix if present (without copying the payload)
+            start = base64_data.index(",") + 1 if base64_data.startswith("data:image") else 0
+
+            # Wrapped base64 would misalign the decode slices; strip all whitespace first (rare)
+            if _WHITESPACE.search(base64_data, start):
+                base64_data = "".join(base64_data[start:].split())
+                start = 0
+
+            # Decoded size is known up front from the base64 length and padding
+            padding = 2 if base64_data.endswith("==") else 1 if base64_data.endswith("=") else 0
+            decoded_size = (len(base64_data) - start) * 3 // 4 - padding
+
+            # Decode slice by slice straight into the file, never holding the whole image
+            with open(temp_path, "wb") as f:
+                if decoded_size > 0 and hasattr(os, "posix_fallocate"):
+                    # Reserve the blocks in one go instead of growing the file write by write
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, decoded_size)
+                    except OSError:
+                        pass  # Not supported by this filesystem; writes still extend the file
+                for offset in range(start, len(base64_data), DECODE_CHUNK_SIZE):
+                    f.write(base64.b64decode(base64_data[offset:offset + DECODE_CHUNK_SIZE]))
+                file_size = f.tell()
+                f.truncate()  # Drop any over-reservation
+
+        os.replace(temp_path, output_path)
 
         print(f"\nSuccess! Image saved to: {output_path}")
 
         # Print file size
-        file_size = len(image_data)
         if file_size < 1024:
             size_str = f"{file_size} bytes"
         elif file_size < 1024 * 1024:
@@ -211,6 +364,8 @@ def save_base64_image(base64_data: str, output_path: str):
         print(f"File size: {size_str}")
 
     except Exception as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
         print(f"Error: Failed to save image: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -276,6 +431,9 @@ Examples:
     aspect_ratio = args.aspect_ratio or DEFAULT_ASPECT_RATIO
     timeout = args.timeout or DEFAULT_TIMEOUT
 
+    # One session for the API call and, if the model returns a hosted URL, the download
+    session = create_session()
+
     # Generate image
     generated_image = generate_image(
         api_key=api_key,
@@ -283,11 +441,12 @@ Examples:
         prompt=args.prompt,
         reference_image_path=args.reference,
         aspect_ratio=aspect_ratio,
-        timeout=timeout
+        timeout=timeout,
+        session=session
     )
 
     # Save image
-    save_base64_image(generated_image, args.output)
+    save_base64_image(generated_image, args.output, session=session, timeout=timeout)
 
 
 if __name__ == "__main__":
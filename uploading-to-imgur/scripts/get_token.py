@@ -5,9 +5,9 @@ Imgur OAuth 认证辅助工具
 帮助用户快速获取 Imgur Access Token
 """
 
-import re
 import sys
 import webbrowser
+from urllib.parse import parse_qs, urlparse
 
 
 def main():
@@ -74,13 +74,17 @@ def main():
     print()
     print("正在解析 URL...")
 
-    # 提取 access_token
-    access_token_match = re.search(r'access_token=([^&]+)', redirect_url)
-    refresh_token_match = re.search(r'refresh_token=([^&]+)', redirect_url)
-    expires_match = re.search(r'expires_in=([^&]+)', redirect_url)
-    username_match = re.search(r'account_username=([^&]+)', redirect_url)
+    # token 位于 URL 的 # 片段中，一次解析出所有参数；
+    # 只粘贴了参数部分（access_token=...&...）时直接解析整个输入
+    parsed_url = urlparse(redirect_url)
+    params = parse_qs(parsed_url.fragment or parsed_url.query or redirect_url)
 
-    if not access_token_match:
+    access_token = params.get("access_token", [None])[0]
+    refresh_token = params.get("refresh_token", [None])[0]
+    expires_in = params.get("expires_in", [None])[0]
+    username = params.get("account_username", [None])[0]
+
+    if not access_token:
         print()
         print("=" * 70)
         print("错误：无法从 URL 中提取 access_token")
@@ -94,11 +98,6 @@ def main():
         print("https://localhost/#access_token=xxx&expires_in=xxx&...")
         sys.exit(1)
 
-    access_token = access_token_match.group(1)
-    refresh_token = refresh_token_match.group(1) if refresh_token_match else None
-    expires_in = expires_match.group(1) if expires_match else None
-    username = username_match.group(1) if username_match else None
-
     # 显示结果
     print()
     print("=" * 70)
@@ -10,14 +10,19 @@ Imgur 图片上传工具
 """
 
 import argparse
-import base64
 import json
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库 json
+    orjson = None
 
 
 # 默认 Client ID（用户需要替换为自己的）
@@ -26,13 +31,72 @@ DEFAULT_CLIENT_ID = "YOUR_CLIENT_ID_HERE"
 # Imgur API 端点
 IMGUR_UPLOAD_URL = "https://api.imgur.com/3/image"
 
+# 支持上传的图片扩展名（元组形式，可直接用于 str.endswith）
+VALID_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff')
+
+# 共享会话的连接池大小（同时保持的 keep-alive 连接数）
+DEFAULT_POOL_SIZE = 16
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    将数据序列化为 UTF-8 编码的 JSON（优先使用 orjson）
+
+    Args:
+        data: 待序列化的数据
+        indent: 是否以 2 空格缩进格式化输出
+
+    Returns:
+        JSON 字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """解析 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    创建复用连接的 HTTP 会话
+
+    多张图片上传时共用同一个 keep-alive 连接池，只需一次 TCP/TLS 握手；
+    遇到 429 和 503 时按指数退避自动重试（遵循 Retry-After）。
+    这两种状态表示请求未被处理；500/502/504 可能发生在上传已完成之后，重试会产生重复图片
+
+    Args:
+        pool_size: 连接池大小，应不小于并发上传数，否则多出的连接用完即被丢弃
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 503],
+        allowed_methods=["POST"],
+        read=False,  # 请求已发出但未收到响应时不重试，避免重复上传
+        raise_on_status=False
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# 模块级共享会话
+_SESSION = create_session()
+
 
 def upload_image_to_imgur(
     image_path: str,
     client_id: str = None,
     access_token: str = None,
     title: str = None,
-    description: str = None
+    description: str = None,
+    session: requests.Session = None
 ) -> Dict[str, Any]:
     """
     上传单张图片到 Imgur
@@ -43,6 +107,7 @@ def upload_image_to_imgur(
         access_token: Imgur Access Token（账号上传）
         title: 图片标题（可选）
         description: 图片描述（可选）
+        session: 复用的 HTTP 会话（默认使用模块级共享会话）
 
     Returns:
         包含上传结果的字典
@@ -56,23 +121,23 @@ def upload_image_to_imgur(
         "imgur_data": None
     }
 
-    # 检查文件是否存在
-    if not os.path.exists(image_path):
+    # 直接打开文件检查是否存在，文件不存在或不可读时由同一处处理（无需事先检查）
+    try:
+        image_file = open(image_path, "rb")
+    except FileNotFoundError:
         result["error"] = "File not found"
         return result
+    except OSError as e:
+        result["error"] = f"Cannot read file: {e}"
+        return result
 
     # 检查是否是图片文件
-    valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff'}
-    file_ext = Path(image_path).suffix.lower()
-    if file_ext not in valid_extensions:
-        result["error"] = f"Invalid image format: {file_ext}"
+    if not image_path.lower().endswith(VALID_EXTENSIONS):
+        image_file.close()
+        result["error"] = f"Invalid image format: {os.path.splitext(image_path)[1].lower()}"
         return result
 
     try:
-        # 读取图片并转换为 base64
-        with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode('utf-8')
-
         # 准备请求头 - 根据认证类型选择
         if access_token:
             # 使用 Access Token（账号上传）
@@ -89,23 +154,26 @@ def upload_image_to_imgur(
             return result
 
         # 准备请求数据
-        payload = {
-            "image": image_data,
-            "type": "base64"
-        }
+        payload = {}
 
         if title:
             payload["title"] = title
         if description:
             payload["description"] = description
 
-        # 发送请求
-        print(f"Uploading: {image_path}...", end=" ", flush=True)
-        response = requests.post(IMGUR_UPLOAD_URL, headers=headers, data=payload, timeout=30)
+        # 发送请求 - 以 multipart/form-data 直接上传二进制文件，无需 base64 编码
+        with image_file as f:
+            response = (session or _SESSION).post(
+                IMGUR_UPLOAD_URL,
+                headers=headers,
+                data=payload,
+                files={"image": (result["filename"], f)},
+                timeout=30
+            )
 
         # 处理响应
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = _loads(response.content)
 
             if response_data.get("success"):
                 data = response_data.get("data", {})
@@ -127,23 +195,28 @@ def upload_image_to_imgur(
                     "description": data.get("description"),
                     "delete_link": f"https://imgur.com/delete/{data.get('deletehash')}" if data.get('deletehash') else None
                 }
-                print("✓ Success")
+                status = "✓ Success"
             else:
                 result["error"] = "Imgur API returned success=false"
-                print("✗ Failed")
+                status = "✗ Failed"
         else:
             result["error"] = f"HTTP {response.status_code}: {response.text}"
-            print(f"✗ Failed (HTTP {response.status_code})")
+            status = f"✗ Failed (HTTP {response.status_code})"
 
     except requests.exceptions.Timeout:
         result["error"] = "Request timeout"
-        print("✗ Timeout")
+        status = "✗ Timeout"
     except requests.exceptions.RequestException as e:
         result["error"] = f"Network error: {str(e)}"
-        print(f"✗ Network error")
+        status = f"✗ Network error"
     except Exception as e:
         result["error"] = f"Unexpected error: {str(e)}"
-        print(f"✗ Error: {e}")
+        status = f"✗ Error: {e}"
+    finally:
+        image_file.close()
+
+    # 整行输出，避免并发上传时进度信息交错
+    print(f"Uploading: {image_path}... {status}")
 
     return result
 
@@ -151,7 +224,8 @@ def upload_image_to_imgur(
 def upload_multiple_images(
     image_paths: List[str],
     client_id: str = None,
-    access_token: str = None
+    access_token: str = None,
+    concurrency: int = 4
 ) -> Dict[str, Any]:
     """
     上传多张图片到 Imgur
@@ -160,6 +234,7 @@ def upload_multiple_images(
         image_paths: 图片文件路径列表
         client_id: Imgur Client ID（匿名上传）
         access_token: Imgur Access Token（账号上传）
+        concurrency: 同时上传的图片数量
 
     Returns:
         包含所有上传结果的字典
@@ -171,14 +246,24 @@ def upload_multiple_images(
         "uploads": []
     }
 
-    for image_path in image_paths:
-        result = upload_image_to_imgur(
+    workers = max(1, min(concurrency, len(image_paths)))
+
+    # 所有图片共用一个会话，并发上传时复用同一个连接池；并发数超过共享连接池大小时使用足够大的专用会话
+    session = _SESSION if workers <= DEFAULT_POOL_SIZE else create_session(pool_size=workers)
+
+    def upload(image_path: str) -> Dict[str, Any]:
+        return upload_image_to_imgur(
             image_path,
             client_id=client_id,
-            access_token=access_token
+            access_token=access_token,
+            session=session
         )
-        results["uploads"].append(result)
 
+    # map 按输入顺序返回结果
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results["uploads"] = list(executor.map(upload, image_paths))
+
+    for result in results["uploads"]:
         if result["success"]:
             results["successful"] += 1
         else:
@@ -291,8 +376,20 @@ Environment variables:
         help="Pretty print JSON output"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Number of images to upload in parallel (default: 4)"
+    )
+
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        print("Error: --concurrency must be >= 1", file=sys.stderr)
+        sys.exit(1)
+
     # 获取认证信息
     # 优先使用命令行参数，否则从环境变量获取
     if args.client_id or args.access_token:
@@ -311,40 +408,43 @@ Environment variables:
     results = upload_multiple_images(
         args.images,
         client_id=client_id,
-        access_token=access_token
+        access_token=access_token,
+        concurrency=args.concurrency
     )
 
-    print("")
-    print("=" * 60)
-    print(f"Upload Summary: {results['successful']} succeeded, {results['failed']} failed")
-    print("=" * 60)
+    # 汇总输出先收集到列表，最后一次性写入 stdout
+    lines = [
+        "",
+        "=" * 60,
+        f"Upload Summary: {results['successful']} succeeded, {results['failed']} failed",
+        "=" * 60,
+    ]
 
     # 格式化输出
-    if args.pretty:
-        json_output = json.dumps(results, indent=2, ensure_ascii=False)
-    else:
-        json_output = json.dumps(results, ensure_ascii=False)
+    json_output = _dumps(results, indent=args.pretty)
 
     # 输出结果
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
+        with open(args.output, "wb") as f:
             f.write(json_output)
-        print(f"\nResults saved to: {args.output}")
+        lines.append(f"\nResults saved to: {args.output}")
     else:
-        print("\nJSON Output:")
-        print(json_output)
+        lines.append("\nJSON Output:")
+        lines.append(json_output.decode("utf-8"))
 
     # 显示成功上传的链接
     successful_uploads = [u for u in results["uploads"] if u["success"]]
     if successful_uploads:
-        print("\n" + "=" * 60)
-        print("Uploaded Image Links:")
-        print("=" * 60)
+        lines.append("\n" + "=" * 60)
+        lines.append("Uploaded Image Links:")
+        lines.append("=" * 60)
         for upload in successful_uploads:
-            print(f"\n{upload['filename']}:")
-            print(f"  Link:   {upload['imgur_data']['link']}")
+            lines.append(f"\n{upload['filename']}:")
+            lines.append(f"  Link:   {upload['imgur_data']['link']}")
             if upload['imgur_data']['delete_link']:
-                print(f"  Delete: {upload['imgur_data']['delete_link']}")
+                lines.append(f"  Delete: {upload['imgur_data']['delete_link']}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # 返回适当的退出码
     sys.exit(0 if results["failed"] == 0 else 1)